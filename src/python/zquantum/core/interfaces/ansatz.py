@@ -1,18 +1,25 @@
 from abc import ABC, abstractmethod
-import numpy as np
+from collections import OrderedDict
 import copy
+import numpy as np
 import sympy
-from typing import List, Optional
+from typing import Callable, List, Optional
 from overrides import EnforceOverrides
 import warnings
 from ..circuit import Circuit
 from .ansatz_utils import ansatz_property
 from ..utils import create_symbols_map
 
+try:
+    import symengine
+except ImportError:
+    symengine = None
+
 
 class Ansatz(ABC, EnforceOverrides):
 
     supports_parametrized_circuits = None
+    exec_cache_max_size = 32
     number_of_layers = ansatz_property("number_of_layers")
 
     def __init__(self, number_of_layers: int):
@@ -26,12 +33,18 @@ class Ansatz(ABC, EnforceOverrides):
             number_of_layers (int): see Args
             parametrized_circuit (zquantum.core.circuit.Circuit): parametrized circuit representation of the ansatz. Might not be supported for given ansatz, see supports_parametrized_circuits.
             supports_parametrized_circuits(bool): flag indicating whether given ansatz supports parametrized circuits.
+            exec_cache_max_size(int): maximal number of executable circuits kept in the cache used by get_executable_circuit.
 
         """
         if number_of_layers < 0:
             raise ValueError("number_of_layers must be non-negative.")
         self.number_of_layers = number_of_layers
         self._parametrized_circuit = None
+        self._cached_symbols = None
+        self._cached_circuit_evaluator = None
+        self._exec_cache = OrderedDict()
+        self._exec_cache_circuit = None
+        self._exec_cache_decimals = None
 
     @property
     def parametrized_circuit(self) -> Circuit:
@@ -59,25 +72,85 @@ class Ansatz(ABC, EnforceOverrides):
         """Returns number of parameters in the ansatz."""
 
         if self.supports_parametrized_circuits:
-            return len(self.parametrized_circuit.symbolic_params)
+            return len(self._get_symbols_cached())
         else:
             raise NotImplementedError
 
     def get_executable_circuit(self, params: np.ndarray) -> Circuit:
         """Returns an executable circuit representing the ansatz.
+        For ansatzes supporting parametrized circuits, the most recently evaluated circuits
+        are cached and each call returns a copy of the cached circuit (see _shallow_clone_circuit).
         Args:
             params: circuit parameters
         """
         if params is None:
             raise (Exception("Parameters can't be None for executable circuit."))
         if self.supports_parametrized_circuits:
-            symbols = self.parametrized_circuit.symbolic_params
-            symbols_map = create_symbols_map(symbols, params)
-            executable_circuit = self.parametrized_circuit.evaluate(symbols_map)
-            return executable_circuit
+            parametrized_circuit = self.parametrized_circuit
+            if self._exec_cache_circuit is not parametrized_circuit:
+                self.clear_exec_cache()
+                self._exec_cache_circuit = parametrized_circuit
+
+            params = np.asarray(params)
+            key_params = (
+                params
+                if self._exec_cache_decimals is None
+                else np.round(params, decimals=self._exec_cache_decimals)
+            )
+            key = (key_params.dtype.str, key_params.shape, key_params.tobytes())
+            if key in self._exec_cache:
+                self._exec_cache.move_to_end(key)
+                return self._shallow_clone_circuit(self._exec_cache[key])
+
+            executable_circuit = self._get_circuit_evaluator_cached()(params)
+
+            self._exec_cache[key] = executable_circuit
+            if len(self._exec_cache) > self.exec_cache_max_size:
+                self._exec_cache.popitem(last=False)
+            return self._shallow_clone_circuit(executable_circuit)
         else:
             return self._generate_circuit(params)
 
+    def clear_exec_cache(self):
+        """Removes all cached executable circuits."""
+        self._exec_cache.clear()
+
+    def set_exec_cache_tolerance(self, decimals: Optional[int]):
+        """Sets how parameters are matched against cached executable circuits.
+
+        By default (decimals=None) a cached circuit is reused only for parameters identical
+        to the ones it was evaluated for. If decimals is given, parameters are rounded to
+        this many decimal places before lookup, so nearly equal parameters (e.g. revisited
+        by line searches) share a cached circuit. The returned circuit is then evaluated
+        at the first of such parameters, which differs from the requested ones by less
+        than 10**(-decimals).
+
+        Args:
+            decimals: number of decimal places to round parameters to, or None for exact matching.
+        """
+        self._exec_cache_decimals = decimals
+        self.clear_exec_cache()
+
+    @staticmethod
+    def _shallow_clone_circuit(circuit: Circuit) -> Circuit:
+        """Returns a copy of the circuit, cheaper than copy.deepcopy.
+
+        Every gate is copied together with its list of params, so gate params can be
+        modified in place on the returned circuit without affecting the original one.
+        The param values themselves (numbers and sympy expressions) are shared,
+        and so are the qubits of the gates.
+        """
+        cloned_circuit = type(circuit)()
+        cloned_circuit.name = circuit.name
+        cloned_circuit.qubits = list(circuit.qubits)
+        cloned_circuit.info = dict(circuit.info)
+        cloned_circuit.gates = []
+        for gate in circuit.gates:
+            cloned_gate = copy.copy(gate)
+            cloned_gate.params = list(gate.params)
+            cloned_circuit.gates.append(cloned_gate)
+        return cloned_circuit
+
     def _generate_circuit(self, params: Optional[np.ndarray] = None) -> Circuit:
         """Returns a circuit represention of the ansatz.
         Will return parametrized circuits if no parameters are passed and the ansatz supports parametrized circuits.
@@ -92,4 +165,147 @@ class Ansatz(ABC, EnforceOverrides):
             """`Ansatz.get_symbols()` will be deprecated in future releases of z-quantumcore.\
                 Please use `self.parametrized_circuit.symbolic_params` instead.""",
         )
-        return self.parametrized_circuit.symbolic_params
+        return list(self._get_symbols_cached())
+
+    def _get_symbols_cached(self) -> List[sympy.Symbol]:
+        """Returns symbolic parameters of the parametrized circuit, computing them only once per circuit.
+
+        The cache is keyed on the circuit object itself, so it is invalidated whenever
+        _parametrized_circuit is reset (e.g. by setters created with ansatz_property).
+        """
+        circuit = self.parametrized_circuit
+        if self._cached_symbols is None or self._cached_symbols[0] is not circuit:
+            self._cached_symbols = (circuit, circuit.symbolic_params)
+        return self._cached_symbols[1]
+
+    def _get_circuit_evaluator_cached(self) -> Callable[[np.ndarray], Circuit]:
+        """Returns a compiled evaluator of the parametrized circuit, compiling it only once per circuit."""
+        circuit = self.parametrized_circuit
+        if (
+            self._cached_circuit_evaluator is None
+            or self._cached_circuit_evaluator[0] is not circuit
+        ):
+            self._cached_circuit_evaluator = (
+                circuit,
+                _compile_circuit_evaluator(circuit, self._get_symbols_cached()),
+            )
+        return self._cached_circuit_evaluator[1]
+
+
+def _compile_circuit_evaluator(
+    circuit: Circuit, symbols: List[sympy.Symbol]
+) -> Callable[[np.ndarray], Circuit]:
+    """Compiles symbolic gate parameters of the circuit into a single numerical function.
+    Subexpressions shared between parameters (e.g. theta / 2) are computed only once.
+
+    Args:
+        circuit: parametrized circuit to be evaluated.
+        symbols: symbols of the circuit, in the order in which values are passed.
+
+    Returns:
+        function mapping a vector of parameter values to a copy of the circuit
+        with all symbolic parameters evaluated, equivalent to circuit.evaluate.
+        Only parameters known to be real for real inputs are compiled and evaluated in
+        double precision, so exact operations (e.g. theta / 2) give the same values as
+        sympy. Circuits whose parameters may be complex or non-finite, depend on no
+        symbols, or cannot be compiled are evaluated by circuit.evaluate instead.
+    """
+    positions = []
+    expressions = []
+    for gate_index, gate in enumerate(circuit.gates):
+        for param_index, param in enumerate(gate.params):
+            if isinstance(param, sympy.Basic):
+                positions.append((gate_index, param_index))
+                expressions.append(param)
+
+    compute_angles = None
+    if expressions and symbols and _are_real_for_real_symbols(expressions, symbols):
+        try:
+            compute_angles = _lambdify_angles(symbols, expressions)
+        except Exception:
+            # E.g. Piecewise is not supported by symengine's Lambdify.
+            compute_angles = None
+    uses_circuit_evaluate = bool(expressions) and compute_angles is None
+
+    def _evaluate(params: np.ndarray) -> Circuit:
+        if len(symbols) != len(params):
+            raise (
+                ValueError(
+                    "Length of symbols: {0} doesn't match length of params: {1}".format(
+                        len(symbols), len(params)
+                    )
+                )
+            )
+        params = np.asarray(params)
+        if uses_circuit_evaluate or np.iscomplexobj(params):
+            return circuit.evaluate(create_symbols_map(symbols, params))
+
+        gate_params = [list(gate.params) for gate in circuit.gates]
+        if compute_angles is not None:
+            try:
+                with np.errstate(all="ignore"):
+                    angles = np.asarray(
+                        compute_angles(params.astype(float))
+                    ).ravel()
+            except Exception:
+                angles = None
+            if (
+                angles is None
+                or angles.dtype.kind not in "iuf"
+                or not np.all(np.isfinite(angles))
+            ):
+                return circuit.evaluate(create_symbols_map(symbols, params))
+            for (gate_index, param_index), angle in zip(
+                positions, angles.astype(float).tolist()
+            ):
+                gate_params[gate_index][param_index] = angle
+
+        evaluated_circuit = type(circuit)()
+        evaluated_circuit.name = circuit.name
+        evaluated_circuit.qubits = circuit.qubits
+        evaluated_circuit.info = circuit.info
+        evaluated_circuit.gates = [
+            type(gate)(name=gate.name, qubits=gate.qubits, params=evaluated_params)
+            for gate, evaluated_params in zip(circuit.gates, gate_params)
+        ]
+        return evaluated_circuit
+
+    return _evaluate
+
+
+def _are_real_for_real_symbols(
+    expressions: List[sympy.Basic], symbols: List[sympy.Symbol]
+) -> bool:
+    """Checks whether all expressions are known to be real when all symbols are real."""
+    real_symbols = {symbol: sympy.Dummy(real=True) for symbol in symbols}
+    return all(
+        expression.xreplace(real_symbols).is_real is True for expression in expressions
+    )
+
+
+def _lambdify_angles(
+    symbols: List[sympy.Symbol], expressions: List[sympy.Basic]
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Compiles real expressions into a function of the vector of symbols' values."""
+    if symengine is not None:
+        return symengine.Lambdify(symbols, expressions, real=True, cse=True)
+
+    replacements, reduced_expressions = sympy.cse(
+        expressions, symbols=sympy.numbered_symbols("_cse", cls=sympy.Dummy)
+    )
+    temporaries = [temporary for temporary, _ in replacements]
+    compute_temporaries = [
+        sympy.lambdify(symbols + temporaries[:index], expression, modules="numpy")
+        for index, (_, expression) in enumerate(replacements)
+    ]
+    compute_reduced = sympy.lambdify(
+        symbols + temporaries, reduced_expressions, modules="numpy"
+    )
+
+    def compute_angles(params):
+        values = list(params)
+        for compute_temporary in compute_temporaries:
+            values.append(compute_temporary(*values))
+        return compute_reduced(*values)
+
+    return compute_angles
@@ -1,5 +1,10 @@
-from ..circuit import Circuit
+from ..circuit import Circuit, Gate, Qubit
+from ..utils import create_symbols_map
+from . import ansatz as ansatz_module
+from .ansatz import Ansatz, _compile_circuit_evaluator
 import numpy as np
+import pytest
+import sympy
 
 
 class AnsatzTests:
@@ -28,6 +33,21 @@ class AnsatzTests:
         if ansatz.number_of_layers != 0:
             assert ansatz.number_of_params >= 0
 
+    def test_number_of_params_is_recomputed_after_changing_number_of_layers(
+        self, ansatz
+    ):
+        if ansatz.supports_parametrized_circuits:
+            # Given
+            ansatz.number_of_params
+
+            # When
+            ansatz.number_of_layers = ansatz.number_of_layers + 1
+
+            # Then
+            assert ansatz.number_of_params == len(
+                ansatz.parametrized_circuit.symbolic_params
+            )
+
     def test_number_of_qubits_greater_than_0(self, ansatz):
         assert ansatz.number_of_qubits > 0
 
@@ -51,3 +71,168 @@ class AnsatzTests:
         # Then
         for gate in circuit.gates:
             assert len(gate.symbolic_params) == 0
+
+
+THETA, PHI = sympy.symbols("theta phi")
+
+
+@pytest.fixture(params=["sympy", "symengine"])
+def symbolic_backend(request, monkeypatch):
+    """Runs the test with both backends used for compiling circuit evaluators."""
+    if request.param == "sympy":
+        monkeypatch.setattr(ansatz_module, "symengine", None)
+    else:
+        monkeypatch.setattr(
+            ansatz_module, "symengine", pytest.importorskip("symengine")
+        )
+    return request.param
+
+
+def _circuit_with_gate_params(gate_params):
+    circuit = Circuit()
+    circuit.qubits = [Qubit(0), Qubit(1)]
+    circuit.gates = [
+        Gate("RX", qubits=[circuit.qubits[index % 2]], params=[param])
+        for index, param in enumerate(gate_params)
+    ]
+    return circuit
+
+
+def test_compiled_circuit_evaluator_gives_the_same_result_as_circuit_evaluate(
+    symbolic_backend,
+):
+    # Given
+    circuit = _circuit_with_gate_params([THETA / 2, 2 * THETA + PHI, sympy.pi, 0.3])
+    symbols = circuit.symbolic_params
+    params = np.array([0.7, -1.2])
+    expected_circuit = circuit.evaluate(create_symbols_map(symbols, params))
+
+    # When
+    evaluated_circuit = _compile_circuit_evaluator(circuit, symbols)(params)
+
+    # Then
+    assert len(evaluated_circuit.gates) == len(expected_circuit.gates)
+    for gate, expected_gate in zip(evaluated_circuit.gates, expected_circuit.gates):
+        assert gate.params == expected_gate.params
+        assert gate == expected_gate
+
+
+@pytest.mark.parametrize("params", [np.array([3]), np.array([0.7]), np.array([0.1])])
+def test_compiled_circuit_evaluator_halves_params_exactly(symbolic_backend, params):
+    # Given
+    circuit = _circuit_with_gate_params([THETA / 2])
+    symbols = circuit.symbolic_params
+    expected_circuit = circuit.evaluate(create_symbols_map(symbols, params))
+
+    # When
+    evaluated_circuit = _compile_circuit_evaluator(circuit, symbols)(params)
+
+    # Then
+    assert evaluated_circuit.gates[0].params == expected_circuit.gates[0].params
+    assert evaluated_circuit == expected_circuit
+
+
+@pytest.mark.parametrize(
+    "gate_param, value",
+    [
+        (sympy.I * THETA, 0.5),
+        (sympy.sqrt(THETA), -0.5),
+        (sympy.log(THETA), -0.5),
+    ],
+)
+def test_compiled_circuit_evaluator_keeps_complex_params_like_circuit_evaluate(
+    symbolic_backend, gate_param, value
+):
+    # Given
+    circuit = _circuit_with_gate_params([gate_param, THETA])
+    symbols = circuit.symbolic_params
+    params = np.array([value])
+
+    # When
+    evaluated_circuit = _compile_circuit_evaluator(circuit, symbols)(params)
+
+    # Then
+    assert evaluated_circuit == circuit.evaluate(create_symbols_map(symbols, params))
+
+
+@pytest.mark.parametrize(
+    "gate_params, params",
+    [
+        ([sympy.pi / 2], np.array([])),
+        ([sympy.Piecewise((0.5, THETA > 0), (1.0, True))], np.array([0.3])),
+        ([sympy.Function("f")(THETA)], np.array([0.5])),
+    ],
+)
+def test_compiled_circuit_evaluator_falls_back_to_circuit_evaluate(
+    symbolic_backend, gate_params, params
+):
+    # Given
+    circuit = _circuit_with_gate_params(gate_params)
+    symbols = circuit.symbolic_params
+
+    # When
+    evaluated_circuit = _compile_circuit_evaluator(circuit, symbols)(params)
+
+    # Then
+    assert evaluated_circuit == circuit.evaluate(create_symbols_map(symbols, params))
+
+
+def test_compiled_circuit_evaluator_raises_error_for_wrong_number_of_params(
+    symbolic_backend,
+):
+    circuit = _circuit_with_gate_params([THETA, PHI])
+    evaluate = _compile_circuit_evaluator(circuit, circuit.symbolic_params)
+
+    with pytest.raises(ValueError):
+        evaluate(np.array([0.1]))
+
+
+def test_compiled_circuit_evaluator_handles_nested_common_subexpressions(
+    symbolic_backend,
+):
+    # Given
+    shared = (THETA + PHI) ** 2
+    gate_params = [
+        THETA / 2,
+        2 * THETA + PHI,
+        3 * shared,
+        shared + PHI,
+        sympy.sin(shared) * (THETA + PHI),
+    ]
+    # Second temporary, (theta + phi)**2, depends on the first one, theta + phi.
+    replacements, _ = sympy.cse(gate_params)
+    assert len(replacements) >= 2
+    circuit = _circuit_with_gate_params(gate_params)
+    symbols = circuit.symbolic_params
+    params = np.array([0.3, -1.1])
+    expected_circuit = circuit.evaluate(create_symbols_map(symbols, params))
+
+    # When
+    evaluated_circuit = _compile_circuit_evaluator(circuit, symbols)(params)
+
+    # Then
+    exact_gates = zip(evaluated_circuit.gates[:2], expected_circuit.gates[:2])
+    for gate, expected_gate in exact_gates:
+        assert gate.params == expected_gate.params
+    # evalf rounds (theta + phi)**2 once at extended precision, while doubles round
+    # after every operation, so these may differ in the last bit.
+    rounded_gates = zip(evaluated_circuit.gates[2:], expected_circuit.gates[2:])
+    for gate, expected_gate in rounded_gates:
+        assert np.isclose(gate.params, expected_gate.params).all()
+
+
+def test_shallow_clone_of_circuit_can_be_modified_without_affecting_original():
+    # Given
+    circuit = _circuit_with_gate_params([THETA, 2 * PHI, 0.5])
+    original_params = [list(gate.params) for gate in circuit.gates]
+
+    # When
+    cloned_circuit = Ansatz._shallow_clone_circuit(circuit)
+    cloned_circuit.gates[0].params[0] = 1.0
+    cloned_circuit.gates.pop()
+
+    # Then
+    assert len(cloned_circuit.gates) == len(circuit.gates) - 1
+    assert cloned_circuit.gates[0].params == [1.0]
+    assert cloned_circuit.gates[1] == circuit.gates[1]
+    assert [gate.params for gate in circuit.gates] == original_params
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from .ansatz_test import AnsatzTests
+from .mock_objects import (
+    MockAnsatz,
+    _VECTORIZED_SAMPLING_THRESHOLD,
+    _sample_random_bitstrings,
+)
+
+
+@pytest.mark.parametrize(
+    "n_samples, n_qubits",
+    [
+        # Just below the threshold, sampled with the random module
+        (_VECTORIZED_SAMPLING_THRESHOLD - 1, 1),
+        # At the threshold, sampled with NumPy
+        (_VECTORIZED_SAMPLING_THRESHOLD, 1),
+        (_VECTORIZED_SAMPLING_THRESHOLD, 3),
+        (5, 0),
+        (_VECTORIZED_SAMPLING_THRESHOLD * 2, 0),
+    ],
+)
+def test_sampled_bitstrings_are_tuples_of_python_ints_with_correct_shape(
+    n_samples, n_qubits
+):
+    bitstrings = _sample_random_bitstrings(n_samples, n_qubits)
+
+    assert len(bitstrings) == n_samples
+    for bitstring in bitstrings:
+        assert isinstance(bitstring, tuple)
+        assert len(bitstring) == n_qubits
+        assert all(type(bit) is int and bit in (0, 1) for bit in bitstring)
+
+
+@pytest.fixture
+def ansatz():
+    return MockAnsatz(number_of_layers=2, problem_size=3)
+
+
+def _count_circuit_evaluations(ansatz, monkeypatch):
+    evaluate = ansatz._get_circuit_evaluator_cached()
+    evaluated_params = []
+
+    def _counting_evaluate(params):
+        evaluated_params.append(params)
+        return evaluate(params)
+
+    monkeypatch.setattr(
+        ansatz, "_get_circuit_evaluator_cached", lambda: _counting_evaluate
+    )
+    return evaluated_params
+
+
+class TestMockAnsatz(AnsatzTests):
+    def test_get_executable_circuit_is_evaluated_once_for_repeated_params(
+        self, ansatz, monkeypatch
+    ):
+        # Given
+        evaluated_params = _count_circuit_evaluations(ansatz, monkeypatch)
+        params = np.random.random([ansatz.number_of_params])
+
+        # When
+        first_circuit = ansatz.get_executable_circuit(params)
+        second_circuit = ansatz.get_executable_circuit(params.copy())
+
+        # Then
+        assert len(evaluated_params) == 1
+        assert second_circuit == first_circuit
+
+    def test_clear_exec_cache_forces_evaluation_of_circuit(self, ansatz, monkeypatch):
+        # Given
+        evaluated_params = _count_circuit_evaluations(ansatz, monkeypatch)
+        params = np.random.random([ansatz.number_of_params])
+        ansatz.get_executable_circuit(params)
+
+        # When
+        ansatz.clear_exec_cache()
+        ansatz.get_executable_circuit(params)
+
+        # Then
+        assert len(evaluated_params) == 2
+
+    def test_modifying_executable_circuit_does_not_affect_cached_one(self, ansatz):
+        # Given
+        params = np.random.random([ansatz.number_of_params])
+        first_circuit = ansatz.get_executable_circuit(params)
+        second_circuit = ansatz.get_executable_circuit(params)
+
+        # When
+        second_circuit.gates[0].params[0] = 42.0
+        second_circuit.gates.pop()
+
+        # Then
+        assert second_circuit is not first_circuit
+        assert ansatz.get_executable_circuit(params) == first_circuit
+
+    def test_get_executable_circuit_reuses_cache_for_params_within_tolerance(
+        self, ansatz, monkeypatch
+    ):
+        # Given
+        evaluated_params = _count_circuit_evaluations(ansatz, monkeypatch)
+        ansatz.set_exec_cache_tolerance(6)
+        params = np.full(ansatz.number_of_params, 0.5)
+
+        # When
+        ansatz.get_executable_circuit(params)
+        ansatz.get_executable_circuit(params + 1e-10)
+
+        # Then
+        assert len(evaluated_params) == 1
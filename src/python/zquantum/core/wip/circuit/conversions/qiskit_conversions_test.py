@@ -213,7 +213,7 @@ def _qiskit_circuit_with_controlled_gate():
     return qc
 
 
-EQUIVALENT_CIRCUITS = [
+EQUIVALENT_CIRCUITS = (
     (
         Circuit(
             [
@@ -251,7 +251,7 @@ EQUIVALENT_CIRCUITS = [
         ),
         _qiskit_circuit_with_controlled_gate(),
     ),
-]
+)
 
 
 def are_qiskit_parameters_equal(param_1, param_2):
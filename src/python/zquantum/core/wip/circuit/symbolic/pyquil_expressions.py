@@ -1,5 +1,5 @@
 """Utilities related to Quil based symbolic expressions."""
-from functools import singledispatch
+from functools import lru_cache, singledispatch, wraps
 import operator
 from numbers import Number
 import pyquil
@@ -16,6 +16,48 @@ QUIL_BINARY_EXPRESSION_NAMES = {
 }
 
 
+# Maximal number of converted expressions cached per kind of composite expression.
+# Cached entries keep their PyQuil expression trees alive until evicted.
+_CONVERSION_CACHE_SIZE = 256
+
+
+class _IdentityKey:
+    """Cache key hashing and comparing wrapped object by identity.
+
+    Holding a reference to the object keeps it alive while the key is cached,
+    hence its id cannot be reused by another object in the meantime.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, _IdentityKey) and other.obj is self.obj
+
+
+def _cached_by_identity(conversion):
+    """Cache results of conversion of composite expressions, keyed on their identity.
+
+    Converting the same expression object repeatedly (e.g. parameter of the same
+    parametrized gate) then skips traversal of its whole tree.
+    """
+
+    @lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
+    def _cached_conversion(key: _IdentityKey):
+        return conversion(key.obj)
+
+    @wraps(conversion)
+    def _conversion(expression):
+        return _cached_conversion(_IdentityKey(expression))
+
+    return _conversion
+
+
 @singledispatch
 def expression_from_pyquil(expression):
     raise NotImplementedError(
@@ -33,7 +75,8 @@ def symbol_from_quil_parameter(parameter: pyquil.quil.Parameter):
     return Symbol(parameter.name)
 
 
-@expression_from_pyquil.register
+@expression_from_pyquil.register(pyquil.quilatom.Function)
+@_cached_by_identity
 def function_call_from_pyquil_function(function: pyquil.quilatom.Function):
     return FunctionCall(
         function.name.lower(),
@@ -46,6 +89,7 @@ def function_call_from_pyquil_function(function: pyquil.quilatom.Function):
 @expression_from_pyquil.register(quilatom.Mul)
 @expression_from_pyquil.register(quilatom.Div)
 @expression_from_pyquil.register(quilatom.Pow)
+@_cached_by_identity
 def function_call_from_pyquil_binary_expression(expression):
     return FunctionCall(
         QUIL_BINARY_EXPRESSION_NAMES[type(expression)],
@@ -56,6 +100,14 @@ def function_call_from_pyquil_binary_expression(expression):
     )
 
 
+def _quil_tan(argument):
+    return quilatom.quil_sin(argument) / quilatom.quil_cos(argument)
+
+
+# Use native tangent if PyQuil provides one, otherwise express it via sin and cos.
+quil_tan = getattr(quilatom, "quil_tan", _quil_tan)
+
+
 # Dialect defining conversion of intermediate expression tree to
 # the expression based on quil functions/parameters.
 # This is intended to be passed by a `dialect` argument of `translate_expression`.
@@ -72,6 +124,6 @@ QUIL_DIALECT = ExpressionDialect(
         "sin": quilatom.quil_sin,
         "exp": quilatom.quil_exp,
         "sqrt": quilatom.quil_sqrt,
-        "tan": lambda arg: quilatom.quil_sin(arg) / quilatom.quil_cos(arg),
+        "tan": quil_tan,
     },
 )
@@ -72,3 +72,11 @@ def test_pyquil_binary_expressions_are_converted_to_appropriate_function_call(
     pyquil_expression, expected_function_call
 ):
     assert expression_from_pyquil(pyquil_expression) == expected_function_call
+
+
+def test_converting_the_same_pyquil_expression_twice_gives_the_same_result():
+    pyquil_expression = quilatom.quil_cos(quil.Parameter("theta")) * 2
+
+    assert expression_from_pyquil(pyquil_expression) is expression_from_pyquil(
+        pyquil_expression
+    )
@@ -24,12 +24,11 @@ def translate_symbol(symbol: Symbol, dialect: ExpressionDialect):
 
 @translate_expression.register
 def translate_function_call(function_call: FunctionCall, dialect: ExpressionDialect):
-    if function_call.name not in dialect.known_functions:
+    function = dialect.known_functions.get(function_call.name)
+    if function is None:
         raise ValueError(f"Function {function_call.name} is unknown in this dialect.")
 
-    return dialect.known_functions[function_call.name](
-        *translate_tuple(function_call.args, dialect)
-    )
+    return function(*translate_tuple(function_call.args, dialect))
 
 
 def translate_tuple(expression_tuple: Iterable[Expression], dialect: ExpressionDialect):